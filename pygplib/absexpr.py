@@ -1,7 +1,36 @@
 """Base class of logical formula as well as index generator"""
 
+import warnings
+import weakref
+
 from .baserelst import BaseRelSt
 
+# Opcodes of NNF construction.
+# Each step of NNF computation pushes a tuple (opcode, cls, arg) to the list of
+# operators in postfix order, which is then evaluated in op.compute_nnf().
+OP_ATOM = 0     # push arg as is
+OP_NEG = 1      # push negation of arg
+OP_LAND = 2     # conjunction of two operands
+OP_LOR = 3      # disjunction of two operands
+OP_FORALL = 4   # universal quantification of operand with bound variable arg
+OP_EXISTS = 5   # existential quantification of operand with bound variable arg
+
+# names of deprecated methods already warned about
+_warned_deprecated = set()
+
+def warn_deprecated(name: str) -> None:
+    """Warns that the method of the given name has been deprecated.
+
+    The warning is issued only once per name so that calling a deprecated
+    method repeatedly, say in a traversal, does not pay for warnings.warn()
+    each time.
+    """
+    if name in _warned_deprecated:
+        return
+    _warned_deprecated.add(name)
+    warn_msg = f"`{name}()` has been deprecated and will be removed in v3.0.0"
+    warnings.warn(warn_msg, UserWarning, stacklevel=3)
+
 class IndexGen:
     """Generates indices.
 
@@ -47,8 +76,13 @@ class AbsExpr:
     and it is not supposed to create a new object
     by invoking an ordinary constructor directly like AbsExpr().
 
+    Instances hold no attributes other than the fields declared in
+    __slots__ (the tag, the operands, and the auxiliary tuple), so that
+    large formulas do not pay for a per-node __dict__.
+
     Attributes:
-        _unique_table: dict. to find an object from its string representation.
+        _unique_table: dict. to find, for each tag, the table that finds an
+            object from its key (see _to_key()).
         _ATOM_TAGS:  tuple of strings, representing types of atom.
         _BINOP_TAGS: tuple of strings, representing types of binary operator.
         _UNOP_TAGS: tuple of strings, representing types of uniary operator.
@@ -58,10 +92,13 @@ class AbsExpr:
         _RPAREN:    string to represent right parentheses.
 
     Note:
-        The current implementation, for the sake of simplicity,
-        does not provide the functionality of deleting unnecessary objects.
+        The unique table holds objects by weak references, so that an object
+        is deleted as soon as it is no longer referred to from anywhere else
+        (the operands of an object are kept alive by the object itself).
     """
 
+    __slots__ = ("_tag", "_left", "_right", "_aux", "__weakref__")
+
     _unique_table = {}
     partitioning_order = False
     """changes order of applying binary operations (see binop_batch())"""
@@ -94,10 +131,9 @@ class AbsExpr:
 
     # Constructor-related Methods
     @staticmethod
-    def _to_key(tag: str, left: "AbsExpr", right: "AbsExpr", aux: tuple, cls_name: str) -> str:
+    def _to_key(tag: str, left: "AbsExpr", right: "AbsExpr", aux: tuple, cls_name: str) -> tuple:
         """Makes key to identify expression."""
-        tup = (tag, id(left), id(right)) + aux + (cls_name,)
-        return ",".join(map(str, tup))
+        return (tag, id(left), id(right)) + aux + (cls_name,)
 
     @classmethod
     def _normalize_aux(cls, tag: str, aux: tuple) -> tuple:
@@ -123,11 +159,16 @@ class AbsExpr:
         # for instance, Prop.true_const() from Fog.true_const().
         key = cls._to_key(tag, left, right, aux, cls_name = cls.__name__)
 
-        if key in cls._unique_table:
-            return cls._unique_table[key]
+        table = cls._unique_table.get(tag)
+        if table is None:
+            table = weakref.WeakValueDictionary()
+            cls._unique_table[tag] = table
+        new = table.get(key)
+        if new is not None:
+            return new
 
         new = super().__new__(cls)
-        cls._unique_table[key] = new
+        table[key] = new
 
         # NOTE: A new object is initialized here.
         new._tag = tag
@@ -155,8 +196,7 @@ class AbsExpr:
 
     def is_atom_term(self) -> bool:
         """Is it an atomic formula ?"""
-        warn_msg = "`is_atom_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_atom_term")
         return self.is_atom()
 
     def is_atom(self) -> bool:
@@ -165,8 +205,7 @@ class AbsExpr:
 
     def is_unop_term(self) -> bool:
         """Is the top-most operator a unary operation ?"""
-        warn_msg = "`is_unop_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_unop_term")
         return self.is_unop()
 
     def is_unop(self) -> bool:
@@ -175,8 +214,7 @@ class AbsExpr:
 
     def is_binop_term(self) -> bool:
         """Is the top-most operator a binary operation ?"""
-        warn_msg = "`is_binop_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_binop_term")
         return self.is_binop()
 
     def is_binop(self) -> bool:
@@ -187,14 +225,13 @@ class AbsExpr:
         """Converts object into string.
 
         The returned string consists of the top-most operator and its operands
-        only, which is mainly used as identifiers
-        (as keys for _unique_table) to decide whether formulas
-        are syntatically identical.
+        only, which is mainly used as identifiers to decide whether formulas
+        are syntatically identical (see _to_key() for keys of _unique_table).
         """
-        return type(self)._to_key(self._tag, self._left, self._right,\
-            self._aux, cls_name=type(self).__name__)
+        return ",".join(map(str, type(self)._to_key(self._tag, self._left,\
+            self._right, self._aux, cls_name=type(self).__name__)))
 
-    def compute_nnf_step(self, negated: bool, s: list[list], t: list[list])\
+    def compute_nnf_step(self, negated: bool, s: list[list], t: list[tuple])\
         -> None:
         """Performs NNF compuation for this object."""
         assert False, f"{self.gen_key()}"
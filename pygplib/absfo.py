@@ -1,6 +1,8 @@
 """Class of first-order logic of graphs with True, False, and no other atom"""
 
 from .absexpr import AbsExpr
+from .absexpr import warn_deprecated
+from .absexpr import OP_FORALL, OP_EXISTS
 from .absprop import AbsProp
 from .name    import NameMgr
 from .baserelst import BaseRelSt
@@ -42,6 +44,8 @@ class AbsFo(AbsProp):
         _EXPR_TAGS: tuple of available tags in this class.
     """
 
+    __slots__ = ()
+
     # Tag-related Variables and Methods
     _FORALL = "!"
     _EXISTS = "?"
@@ -112,62 +116,45 @@ class AbsFo(AbsProp):
 
     def is_forall_term(self) -> bool:
         """Is the top-most operator the universal quantifier ?"""
-        warn_msg = "`is_forall_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_forall_term")
         return self.is_forall()
 
     def is_forall(self) -> bool:
         """Is the top-most operator the universal quantifier ?"""
-        return self.get_tag() == type(self)._FORALL
+        return self._tag == self._FORALL
 
     def is_exists_term(self) -> bool:
         """Is the top-most operator the existential quantifier ?"""
-        warn_msg = "`is_exists_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_exists_term")
         return self.is_exists()
 
     def is_exists(self) -> bool:
         """Is the top-most operator the existential quantifier ?"""
-        return self.get_tag() == type(self)._EXISTS
+        return self._tag == self._EXISTS
 
     def is_qf_term(self) -> bool:
         """Is the top-most operator universal or existential quantifier ?"""
-        warn_msg = "`is_qf_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_qf_term")
         return self.is_qf()
 
     def is_qf(self) -> bool:
         """Is the top-most operator universal or existential quantifier ?"""
-        return self.get_tag() in type(self)._QF_TAGS
+        return self._tag in self._QF_TAGS
 
-    def compute_nnf_step(self, negated: bool, s: list[list], t: list[list]) -> None:
+    def compute_nnf_step(self, negated: bool, s: list[list], t: list[tuple]) -> None:
         """Performs NNF computation for this object."""
 
         f = self.get_operand(1)
 
         if self.is_forall():  # not ! f = ? not f
-            bvar = self.get_bound_var()
-            t.append(
-                [
-                    1,
-                    lambda z: type(self).exists(z, bvar)
-                    if negated
-                    else type(self).forall(z, bvar),
-                ]
-            )
+            t.append((OP_EXISTS if negated else OP_FORALL, type(self),
+                      self.get_bound_var()))
             s.append([negated, f])
             return
 
         if self.is_exists():  # not ? f = ! not f
-            bvar = self.get_bound_var()
-            t.append(
-                [
-                    1,
-                    lambda z: type(self).forall(z, bvar)
-                    if negated
-                    else type(self).exists(z, bvar),
-                ]
-            )
+            t.append((OP_FORALL if negated else OP_EXISTS, type(self),
+                      self.get_bound_var()))
             s.append([negated, f])
             return
 
@@ -186,39 +173,49 @@ class AbsFo(AbsProp):
     ) -> None:
         """Performs computation in postfix order for this object."""
         if self.is_forall() or self.is_exists():
-            bound_vars.remove(self.get_bound_var())
+            # Pre and post steps are nested, so bound_vars is a stack.
+            bvar = bound_vars.pop()
+            assert bvar == self.get_bound_var()
             return
 
     def substitute_step(self, y: int, x: int, assoc: dict) -> None:
-        """Performs substitution for this object."""
+        """Performs substitution for this object.
+
+        If no operand is changed by substitution, this object itself is
+        associated, without looking up the unique table again.
+        """
+        tag = self.get_tag()
 
-        if self.is_neg():
-            g = assoc[id(self.get_operand(1))]
-            assoc[id(self)] = type(self).neg(g)
+        if tag == self._NEG:
+            op = self.get_operand(1)
+            g = assoc[op]
+            assoc[self] = self if g is op else type(self).neg(g)
             return
 
-        if self.is_true_atom() or self.is_false_atom():
-            assoc[id(self)] = self
+        if tag == self._TRUE_CONST or tag == self._FALSE_CONST:
+            assoc[self] = self
             return
 
-        if (
-            self.is_land()
-            or self.is_lor()
-            or self.is_implies()
-            or self.is_iff()
-        ):
-            left = assoc[id(self.get_operand(1))]
-            right = assoc[id(self.get_operand(2))]
-            assoc[id(self)] = type(self).binop(self.get_tag(), left, right)
+        if tag in self._BINOP_TAGS:
+            op1 = self.get_operand(1)
+            op2 = self.get_operand(2)
+            left = assoc[op1]
+            right = assoc[op2]
+            if left is op1 and right is op2:
+                assoc[self] = self
+            else:
+                assoc[self] = type(self).binop(tag, left, right)
             return
 
-        if self.is_forall() or self.is_exists():
+        if tag in self._QF_TAGS:
             bvar = self.get_bound_var()
             if bvar == x:
-                assoc[id(self)] = self
+                assoc[self] = self
             else:
-                g = assoc[id(self.get_operand(1))]
-                assoc[id(self)] = type(self).qf(self.get_tag(), g, bvar)
+                op = self.get_operand(1)
+                g = assoc[op]
+                assoc[self] = self if g is op \
+                    else type(self).qf(tag, g, bvar)
             return
 
         assert False
@@ -228,62 +225,55 @@ class AbsFo(AbsProp):
 
         if self.is_forall():
             bvar = self.get_bound_var()
-            g = assoc[id(self.get_operand(1))]
+            g = assoc[self.get_operand(1)]
 
             if g.is_true_atom():
                 # ! [x] : T = T
-                assoc[id(self)] = type(self).true_const()
+                assoc[self] = type(self).true_const()
                 return
 
             if g.is_false_atom():
-                if st != None:
+                if st is not None:
                     if len(st.domain) > 0:
                         # ! [x] : F = F if there is at least one object.
-                        assoc[id(self)] = type(self).false_const()
+                        assoc[self] = type(self).false_const()
                     else:
                         # ! [x] : F = T if there is no object.
-                        assoc[id(self)] = type(self).true_const()
+                        assoc[self] = type(self).true_const()
                     return
 
-            assoc[id(self)] = type(self).forall(g, bvar)
+            assoc[self] = type(self).forall(g, bvar)
             return
 
         if self.is_exists():
             bvar = self.get_bound_var()
-            g = assoc[id(self.get_operand(1))]
+            g = assoc[self.get_operand(1)]
 
             if g.is_true_atom():
-                if st != None:
+                if st is not None:
                     if len(st.domain) > 0:
                         # ? [x] : T = T if there is at least one object.
-                        assoc[id(self)] = type(self).true_const()
+                        assoc[self] = type(self).true_const()
                     else:
                         # ? [x] : T = F if there is no object.
-                        assoc[id(self)] = type(self).false_const()
+                        assoc[self] = type(self).false_const()
                     return
 
             if g.is_false_atom():
                 # ? [x] : F = F
-                assoc[id(self)] = type(self).false_const()
+                assoc[self] = type(self).false_const()
                 return
 
-            assoc[id(self)] = type(self).exists(g, bvar)
+            assoc[self] = type(self).exists(g, bvar)
             return
 
         super().reduce_formula_step(assoc, st)
 
     def make_str_pre_step(self) -> str:
         """Makes string in prefix order for this object."""
-        if self.is_forall() or self.is_exists():
-            out = "("
-            out += ( \
-                type(self).get_forall_tag() if self.is_forall() \
-                                       else type(self).get_exists_tag()\
-            )
-            out += " "
-            out += f"[{NameMgr.lookup_name(self.get_bound_var())}] :"
-            out += " "
-            return out
+        if self.is_qf():
+            name = NameMgr.lookup_name(self.get_bound_var())
+            return f"({self.get_tag()} [{name}] : "
         return super().make_str_pre_step()
 
     def make_str_in_step(self) -> str:
@@ -301,7 +291,6 @@ class AbsFo(AbsProp):
     def make_node_str_step(self) -> str:
         """Makes string of this object for DOT print."""
         if self.is_forall() or self.is_exists():
-            bvar = self.get_bound_var()
-            name = NameMgr.lookup_name(bvar)
-            return f'"! [{name}] :"' if self.is_forall() else f'"? [{name}] :"'
+            name = NameMgr.lookup_name(self.get_bound_var())
+            return f'"{self.get_tag()} [{name}] :"'
         return super().make_node_str_step()
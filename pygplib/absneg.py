@@ -1,6 +1,8 @@
 """Class of abstract logical formula with true/false constants and negation"""
 from .absexpr import AbsExpr
+from .absexpr import warn_deprecated
 from .absexpr import IndexGen
+from .absexpr import OP_ATOM, OP_NEG
 from .baserelst import BaseRelSt
 
 
@@ -22,8 +24,12 @@ class AbsNeg(AbsExpr):
         _BINOP_TAGS: tuple of strings, representing types of binary operator.
         _UNOP_TAGS: tuple of strings, representing types of uniary operator.
         _EXPR_TAGS: tuple of available tags in this class.
+        _true_atom:  true atom of each class, set by true_const().
+        _false_atom: false atom of each class, set by false_const().
     """
 
+    __slots__ = ()
+
     # Tag-related Variables and Methods
     _NEG = "~"
     _TRUE_CONST = "T"
@@ -62,51 +68,66 @@ class AbsNeg(AbsExpr):
 
     @classmethod
     def true_const(cls) -> AbsExpr:
-        """Gets the true atom, the atom that always evaluates to true."""
-        return cls(cls._TRUE_CONST)
+        """Gets the true atom, the atom that always evaluates to true.
+
+        The atom is created once per class and cached in the class, which
+        also keeps it alive in the unique table.
+        """
+        res = cls.__dict__.get("_true_atom")
+        if res is None:
+            res = cls(cls._TRUE_CONST)
+            cls._true_atom = res
+        return res
 
     @classmethod
     def false_const(cls) -> AbsExpr:
-        """Gets the false atom, the atom that always evaluates to false."""
-        return cls(cls._FALSE_CONST)
+        """Gets the false atom, the atom that always evaluates to false.
+
+        The atom is created once per class and cached in the class, which
+        also keeps it alive in the unique table.
+        """
+        res = cls.__dict__.get("_false_atom")
+        if res is None:
+            res = cls(cls._FALSE_CONST)
+            cls._false_atom = res
+        return res
 
     # Instance Methods
     def is_neg_term(self) -> bool:
         """Is the top-most operator the logical negation ?"""
-        warn_msg = "`is_neg_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_neg_term")
         return self.is_neg()
 
     def is_neg(self) -> bool:
         """Is the top-most operator the logical negation ?"""
-        return self.get_tag() == type(self)._NEG
+        return self._tag == self._NEG
 
     def is_true_atom(self) -> bool:
         """Is it the true constant atom ?"""
-        return self.get_tag() == type(self)._TRUE_CONST
+        return self._tag == self._TRUE_CONST
 
     def is_false_atom(self) -> bool:
         """Is it the false constant atom ?"""
-        return self.get_tag() == type(self)._FALSE_CONST
+        return self._tag == self._FALSE_CONST
 
     def is_const_atom(self) -> bool:
         """Is it either the true constant atom or the false constant atom ?"""
-        return self.is_true_atom() or self.is_false_atom()
+        return self._tag == self._TRUE_CONST or self._tag == self._FALSE_CONST
 
-    def compute_nnf_step(self, negated: bool, s: list[list], t: list[list]) -> None:
+    def compute_nnf_step(self, negated: bool, s: list[list], t: list[tuple]) -> None:
         """Perform NNF computation for this object."""
 
         if self.is_neg():  # not not f = f
             f = self.get_operand(1)
-            s.append([not negated, f])
-            t.append([1, lambda x: x])
+            if f.is_neg():
+                # consume both negations at once
+                s.append([negated, f.get_operand(1)])
+            else:
+                s.append([not negated, f])
             return
 
         if self.is_true_atom() or self.is_false_atom():
-            if negated:
-                t.append([0, lambda: type(self).neg(self)])
-            else:
-                t.append([0, lambda: self])
+            t.append((OP_NEG if negated else OP_ATOM, type(self), self))
             return
 
         super().compute_nnf_step(negated, s, t)
@@ -116,12 +137,11 @@ class AbsNeg(AbsExpr):
         """Performs CNF computation for this object."""
         if self.is_neg():  # a <-> -b :  (-a or -b) and (a or b)
             a = igen.get_next()
-            b = assoc[id(self.get_operand(1))]
+            b = assoc[self.get_operand(1)]
 
-            cnf.append((-a, -b))
-            cnf.append((a, b))
+            cnf.extend(((-a, -b), (a, b)))
 
-            assoc[id(self)] = a
+            assoc[self] = a
             return
 
         assert (
@@ -132,17 +152,17 @@ class AbsNeg(AbsExpr):
     def reduce_formula_step(self, assoc: dict, st: BaseRelSt) -> None:
         """Performs reduce computation for this object."""
         if self.is_neg():
-            g = assoc[id(self.get_operand(1))]
+            g = assoc[self.get_operand(1)]
             if g.is_true_atom():
-                assoc[id(self)] = type(self).false_const()
+                assoc[self] = type(self).false_const()
                 return
             if g.is_false_atom():
-                assoc[id(self)] = type(self).true_const()
+                assoc[self] = type(self).true_const()
                 return
-            assoc[id(self)] = type(self).neg(g)
+            assoc[self] = type(self).neg(g)
             return
         if self.is_true_atom() or self.is_false_atom():
-            assoc[id(self)] = self
+            assoc[self] = self
             return
         super().reduce_formula_step(assoc, st)
 
@@ -1,10 +1,11 @@
 """Class of propositional logic with true and false and no variable"""
 
-import warnings
 import functools
 
 from .absexpr import AbsExpr
+from .absexpr import warn_deprecated
 from .absexpr import IndexGen
+from .absexpr import OP_LAND, OP_LOR
 from .absneg  import AbsNeg
 from .baserelst import BaseRelSt
 
@@ -28,8 +29,12 @@ class AbsProp(AbsNeg):
         _BINOP_TAGS: tuple of strings, representing types of binary operator.
         _UNOP_TAGS: tuple of strings, representing types of uniary operator.
         _EXPR_TAGS: tuple of available tags in this class.
+        _NNF_RULES: dict, mapping (tag, negated) to the opcode of NNF and
+                    whether the left and the right operands are negated.
     """
 
+    __slots__ = ()
+
     # Tag-related Variables and Methods
     _LAND = "&"
     _LOR = "|"
@@ -42,6 +47,15 @@ class AbsProp(AbsNeg):
 
     _EXPR_TAGS = _ATOM_TAGS + _BINOP_TAGS + _UNOP_TAGS
 
+    _NNF_RULES = {
+        (_LAND, False):     (OP_LAND, False, False),  # f and g
+        (_LAND, True):      (OP_LOR, True, True),     # not f or not g
+        (_LOR, False):      (OP_LOR, False, False),   # f or g
+        (_LOR, True):       (OP_LAND, True, True),    # not f and not g
+        (_IMPLIES, False):  (OP_LOR, True, False),    # not f or g
+        (_IMPLIES, True):   (OP_LAND, False, True),   # f and not g
+    }
+
     @classmethod
     def get_land_tag(cls) -> str:
         """Gets tag of logical AND."""
@@ -137,26 +151,38 @@ class AbsProp(AbsNeg):
                 f"Operation specified by {tag} cannot be done in batch.")
         if len(expr_li) == 0:
             raise ValueError("Expression list is empty.")
-
-        def binop_batch_rec(tag: str, expr_li: list, begin: int, end: int) -> AbsExpr:
-            assert begin < end
-
-            if begin + 1 == end:
-                return expr_li[begin]
-            if begin + 2 == end:
-                left = expr_li[begin]
-                right = expr_li[begin + 1]
-                return type(left).binop(tag, left, right)
-
-            mid = (begin + end) // 2
-            left = binop_batch_rec(tag, expr_li, begin, mid)
-            right = binop_batch_rec(tag, expr_li, mid, end)
-            return type(left).binop(tag, left, right)
+        if len(expr_li) == 1:
+            return expr_li[0]
+        if len(expr_li) == 2:
+            return cls.binop(tag, expr_li[0], expr_li[1])
+
+        def binop_batch_part(tag: str, expr_li: list) -> AbsExpr:
+            # Applies operations in the same order as recursively partitioning
+            # operands into halves, with an explicit stack of index ranges.
+            res = []  # operands already built, in postfix order
+            stack = [(0, len(expr_li), False)]
+            while stack != []:
+                begin, end, done = stack.pop()
+                if begin + 1 == end:
+                    res.append(expr_li[begin])
+                    continue
+                if done:
+                    right = res.pop()
+                    left = res.pop()
+                    res.append(type(left).binop(tag, left, right))
+                    continue
+                mid = (begin + end) // 2
+                stack.append((begin, end, True))
+                stack.append((mid, end, False))
+                stack.append((begin, mid, False))
+            assert len(res) == 1
+            return res[0]
 
         if cls.partitioning_order:
-            res = binop_batch_rec(tag, expr_li, 0, len(expr_li))
+            res = binop_batch_part(tag, expr_li)
         else:
-            res = functools.reduce(lambda x,y: cls.binop(tag, x,y), expr_li)
+            binop = cls.land if tag == cls._LAND else cls.lor
+            res = functools.reduce(binop, expr_li)
         return res
 
     @classmethod
@@ -165,107 +191,70 @@ class AbsProp(AbsNeg):
         if len(left_li) != len(right_li):
             raise Exception("Unmatching list length")
 
-        return [cls.binop(tag, le, ri) for le, ri in zip(left_li, right_li)]
+        return list(map(functools.partial(cls.binop, tag), left_li, right_li))
 
     # Instance Methods
     def is_land_term(self) -> bool:
         """Is the top-most operator logical conjunction ?"""
-        warn_msg = "`is_land_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_land_term")
         return self.is_land()
 
     def is_land(self) -> bool:
         """Is the top-most operator logical conjunction ?"""
-        return self.get_tag() == type(self)._LAND
+        return self._tag == self._LAND
 
     def is_lor_term(self) -> bool:
         """Is the top-most operator logical disjunction ?"""
-        warn_msg = "`is_lor_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_lor_term")
         return self.is_lor()
 
     def is_lor(self) -> bool:
         """Is the top-most operator logical disjunction ?"""
-        return self.get_tag() == type(self)._LOR
+        return self._tag == self._LOR
 
     def is_implies_term(self) -> bool:
         """Is the top-most operator logical implication ?"""
-        warn_msg = "`is_implies_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_implies_term")
         return self.is_implies()
 
     def is_implies(self) -> bool:
         """Is the top-most operator logical implication ?"""
-        return self.get_tag() == type(self)._IMPLIES
+        return self._tag == self._IMPLIES
 
     def is_iff_term(self) -> bool:
         """Is the top-most operator logical equivalence ?"""
-        warn_msg = "`is_iff_term()` has been deprecated and will be removed in v3.0.0"
-        warnings.warn(warn_msg, UserWarning)
+        warn_deprecated("is_iff_term")
         return self.is_iff()
 
     def is_iff(self) -> bool:
         """Is the top-most operator logical equivalence ?"""
-        return self.get_tag() == type(self)._IFF
+        return self._tag == self._IFF
 
-    def compute_nnf_step(self, negated: bool, s: list[list], t: list[list]) -> None:
+    def compute_nnf_step(self, negated: bool, s: list[list], t: list[tuple]) -> None:
         """Performs NNF computation for this object."""
 
+        tag = self.get_tag()
         f = self.get_operand(1)
         g = self.get_operand(2)
 
-        if self.is_land():
-            if negated:
-                # not (f and g) = not f or not g
-                t.append([2, lambda y, z: type(self).lor(y, z)])
-                s.append([True, f])
-                s.append([True, g])
-                return
-            else:
-                # f and g
-                t.append([2, lambda y, z: type(self).land(y, z)])
-                s.append([False, f])
-                s.append([False, g])
-                return
-
-        if self.is_lor():
-            if negated:
-                # not (f or g) = not f and not g
-                t.append([2, lambda y, z: type(self).land(y, z)])
-                s.append([True, f])
-                s.append([True, g])
-                return
-            else:
-                # f or g
-                t.append([2, lambda y, z: type(self).lor(y, z)])
-                s.append([False, f])
-                s.append([False, g])
-                return
-
-        if self.is_implies():
-            if negated:
-                # not (f -> g) = f and not g
-                t.append([2, lambda y, z: type(self).land(y, z)])
-                s.append([False, f])
-                s.append([True, g])
-                return
-            else:
-                # f -> g = not f or g
-                t.append([2, lambda y, z: type(self).lor(y, z)])
-                s.append([True, f])
-                s.append([False, g])
-                return
+        rule = self._NNF_RULES.get((tag, negated))
+        if rule is not None:
+            code, neg_left, neg_right = rule
+            t.append((code, type(self), None))
+            s.append([neg_left, f])
+            s.append([neg_right, g])
+            return
 
-        if self.is_iff():
+        if tag == self._IFF:
             if negated:
                 # not (f <-> g) = not (f -> g) or not (g -> f)
-                t.append([2, lambda y, z: type(self).lor(y, z)])
+                t.append((OP_LOR, type(self), None))
                 s.append([True, type(self).implies(f, g)])
                 s.append([True, type(self).implies(g, f)])
                 return
             else:
                 #    (f <-> g) =  (f -> g) and (g -> f)
-                t.append([2, lambda y, z: type(self).land(y, z)])
+                t.append((OP_LAND, type(self), None))
                 s.append([False, type(self).implies(f, g)])
                 s.append([False, type(self).implies(g, f)])
                 return
@@ -275,196 +264,129 @@ class AbsProp(AbsNeg):
     def compute_cnf_step(self, igen: IndexGen, \
         assoc: dict, cnf: list) -> None:
         """Performs CNF computation for this object."""
+        tag = self.get_tag()
 
         # a <-> b and c:  (-a or b) and (-a or c) and (a or -b or -c)
-        if self.is_land():
+        if tag == self._LAND:
             a = igen.get_next()
-            b = assoc[id(self.get_operand(1))]
-            c = assoc[id(self.get_operand(2))]
+            b = assoc[self.get_operand(1)]
+            c = assoc[self.get_operand(2)]
 
-            cnf.append((-a, b))
-            cnf.append((-a, c))
-            cnf.append((a, -b, -c))
+            cnf.extend(((-a, b), (-a, c), (a, -b, -c)))
 
-            assoc[id(self)] = a
+            assoc[self] = a
             return
 
         # a <-> b or  c:  (a or -c) and (a or -b) and (-a or b or c)
-        if self.is_lor():
+        if tag == self._LOR:
             a = igen.get_next()
-            b = assoc[id(self.get_operand(1))]
-            c = assoc[id(self.get_operand(2))]
+            b = assoc[self.get_operand(1)]
+            c = assoc[self.get_operand(2)]
 
-            cnf.append((a, -c))
-            cnf.append((a, -b))
-            cnf.append((-a, b, c))
+            cnf.extend(((a, -c), (a, -b), (-a, b, c)))
 
-            assoc[id(self)] = a
+            assoc[self] = a
             return
 
         assert (
-            not self.is_implies() and not self.is_iff()
+            not tag == self._IMPLIES and not tag == self._IFF
         ), "compute_cnf_step() assumes reduced formulas"
         super().compute_cnf_step(igen, assoc, cnf)
 
     def reduce_formula_step(self, assoc: dict, st: BaseRelSt) -> None:
-        """Performs reduce computation for this object."""
-        if self.is_land():
-            left = assoc[id(self.get_operand(1))]
-            right = assoc[id(self.get_operand(2))]
-
-            if left.is_true_atom():  # T and right = right
-                assoc[id(self)] = right
-                return
-
-            if left.is_false_atom():  # F and right = F
-                assoc[id(self)] = type(self).false_const()
-                return
-
-            if right.is_true_atom():  # left and T = left
-                assoc[id(self)] = left
-                return
-
-            if right.is_false_atom():  # left and F = F
-                assoc[id(self)] = type(self).false_const()
-                return
-
-            if left == right:  # left and left = left
-                assoc[id(self)] = left
-                return
+        """Performs reduce computation for this object.
 
-            assoc[id(self)] = type(self).land(left, right)
+        Since constant atoms and reduced operands are hash-consed,
+        they are compared by identity.
+        """
+        tag = self.get_tag()
+        if tag not in self._BINOP_TAGS:
+            super().reduce_formula_step(assoc, st)
             return
 
-        if self.is_lor():
-            left = assoc[id(self.get_operand(1))]
-            right = assoc[id(self.get_operand(2))]
-
-            if left.is_true_atom():  # T or right = T
-                assoc[id(self)] = type(self).true_const()
-                return
-
-            if left.is_false_atom():  # F or right = right
-                assoc[id(self)] = right
-                return
-
-            if right.is_true_atom():  # left or T = T
-                assoc[id(self)] = type(self).true_const()
-                return
-
-            if right.is_false_atom():  # left or F = left
-                assoc[id(self)] = left
-                return
-
-            if left == right:  # left or left = left
-                assoc[id(self)] = left
-                return
-
-            assoc[id(self)] = type(self).lor(left, right)
+        cls = type(self)
+        true = cls.true_const()
+        false = cls.false_const()
+        left = assoc[self.get_operand(1)]
+        right = assoc[self.get_operand(2)]
+
+        if tag == self._LAND:
+            if left is true:  # T and right = right
+                assoc[self] = right
+            elif left is false or right is false:  # F and right = left and F = F
+                assoc[self] = false
+            elif right is true or left is right:  # left and T = left and left = left
+                assoc[self] = left
+            else:
+                assoc[self] = cls.land(left, right)
             return
 
-        if self.is_implies():
-            left = assoc[id(self.get_operand(1))]
-            right = assoc[id(self.get_operand(2))]
-
-            if left.is_true_atom():  # T -> right = right
-                assoc[id(self)] = right
-                return
-
-            if left.is_false_atom():  # F -> right = T
-                assoc[id(self)] = type(self).true_const()
-                return
-
-            if right.is_true_atom():  # left -> T = T
-                assoc[id(self)] = type(self).true_const()
-                return
-
-            if right.is_false_atom():  # left -> F = ~left
-                assoc[id(self)] = type(self).neg(left)
-                return
-
-            if left == right: # left -> left = T
-                assoc[id(self)] = type(self).true_const()
-                return
-
-            # left -> right = ~left | right
-            assoc[id(self)] = type(self).lor(type(self).neg(left), right)
+        if tag == self._LOR:
+            if left is true or right is true:  # T or right = left or T = T
+                assoc[self] = true
+            elif left is false:  # F or right = right
+                assoc[self] = right
+            elif right is false or left is right:  # left or F = left or left = left
+                assoc[self] = left
+            else:
+                assoc[self] = cls.lor(left, right)
             return
 
-        if self.is_iff():
-            left = assoc[id(self.get_operand(1))]
-            right = assoc[id(self.get_operand(2))]
-
-            if left.is_true_atom():  # T <-> right = right
-                assoc[id(self)] = right
-                return
-
-            if left.is_false_atom():  # F <-> right = ~right
-                assoc[id(self)] = type(self).neg(right)
-                return
-
-            if right.is_true_atom():  # left <-> T = left
-                assoc[id(self)] = left
-                return
-
-            if right.is_false_atom():  # left <-> F = ~left
-                assoc[id(self)] = type(self).neg(left)
-                return
-
-            if left == right: # left <-> left = T
-                assoc[id(self)] = type(self).true_const()
-                return
-
-            # left <-> right = (~left | right) & (left | ~right)
-            assoc[id(self)] = type(self).land(
-                type(self).lor(type(self).neg(left), right),
-                type(self).lor(left, type(self).neg(right)))
+        if tag == self._IMPLIES:
+            if left is true:  # T -> right = right
+                assoc[self] = right
+            elif left is false or right is true or left is right:
+                # F -> right = left -> T = left -> left = T
+                assoc[self] = true
+            elif right is false:  # left -> F = ~left
+                assoc[self] = cls.neg(left)
+            else:  # left -> right = ~left | right
+                assoc[self] = cls.lor(cls.neg(left), right)
             return
 
-        super().reduce_formula_step(assoc, st)
+        assert tag == self._IFF
+        if left is true:  # T <-> right = right
+            assoc[self] = right
+        elif left is false:  # F <-> right = ~right
+            assoc[self] = cls.neg(right)
+        elif right is true:  # left <-> T = left
+            assoc[self] = left
+        elif right is false:  # left <-> F = ~left
+            assoc[self] = cls.neg(left)
+        elif left is right:  # left <-> left = T
+            assoc[self] = true
+        else:  # left <-> right = (~left | right) & (left | ~right)
+            assoc[self] = cls.land(cls.lor(cls.neg(left), right),
+                                   cls.lor(left, cls.neg(right)))
 
     def make_str_pre_step(self) -> str:
         """Makes string in prefix order for this object."""
-        if (
-            self.is_land()
-            or self.is_lor()
-            or self.is_implies()
-            or self.is_iff()
-        ):
+        if self.get_tag() in self._BINOP_TAGS:
             return "("
         return super().make_str_pre_step()
 
     def make_str_in_step(self) -> str:
         """Makes string in infix order for this object."""
-        if self.is_land():
-            return " " + type(self).get_land_tag() + " "
-        if self.is_lor():
-            return " " + type(self).get_lor_tag() + " "
-        if self.is_implies():
-            return " " + type(self).get_implies_tag() + " "
-        if self.is_iff():
-            return " " + type(self).get_iff_tag() + " "
+        tag = self.get_tag()
+        if tag in self._BINOP_TAGS:
+            return f" {tag} "
         return super().make_str_in_step()
 
     def make_str_post_step(self) -> str:
         """Makes string in postfix order for this object."""
-        if (
-            self.is_land()
-            or self.is_lor()
-            or self.is_implies()
-            or self.is_iff()
-        ):
+        if self.get_tag() in self._BINOP_TAGS:
             return ")"
         return super().make_str_post_step()
 
     def make_node_str_step(self) -> str:
         """Makes string of this object for DOT print."""
-        if self.is_land():
+        tag = self.get_tag()
+        if tag == self._LAND:
             return "AND"
-        if self.is_lor():
+        if tag == self._LOR:
             return "OR"
-        if self.is_implies():
+        if tag == self._IMPLIES:
             return "IMP"
-        if self.is_iff():
+        if tag == self._IFF:
             return "IFF"
         return super().make_node_str_step()
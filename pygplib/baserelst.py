@@ -21,6 +21,8 @@ class BaseRelSt(Be):
         """Initializes an object of BaseRelSt class."""
         self.domain = objects
         """tuple of objects (constant symbol indices)"""
+        self._domain_set = frozenset(objects)
+        """set of objects for membership tests"""
         self._codes = codes
         """tuple of codes"""
         self._pos = {}
@@ -32,6 +34,8 @@ class BaseRelSt(Be):
                 raise Exception(f"the codes of position {self._pos[tup]} "\
                 +f"and {pos} coincides: {self._codes}: "+msg)
             self._pos[tup] = pos
+        self._masks = tuple(sum(1 << (i-1) for i in tup) for tup in codes)
+        """tuple of codes as bitmasks, where bit i-1 is set if i is in code"""
         super().__init__(length)
 
     def _object_to_pos(self, obj: int) -> int:
@@ -99,3 +103,20 @@ class BaseRelSt(Be):
                 f"{NameMgr.lookup_name(obj)} is not constant symbol")
 
         return self._codes[self._object_to_pos(obj)]
+
+    def get_code_mask(self, obj: int) -> int:
+        """Returns the code of an object as a bitmask.
+
+        Bit i-1 of the returned integer is set if and only if i is in the code
+        returned by get_code().
+
+        Args:
+            obj: constant symbol index
+        """
+        if not NameMgr.has_name(obj):
+            raise ValueError(f"{obj} has no name")
+        if not NameMgr.is_constant(obj):
+            raise ValueError(\
+                f"{NameMgr.lookup_name(obj)} is not constant symbol")
+
+        return self._masks[self._object_to_pos(obj)]
@@ -2,14 +2,16 @@
 
 import warnings
 
-from functools import cmp_to_key
-
 import pyparsing as pp
 # Enables "packrat" parsing, which speedup parsing.
 # See https://pyparsing-docs.readthedocs.io/en/latest/pyparsing.html .
-pp.ParserElement.enable_packrat()
+# Without it, infix_notation backtracks exponentially in nested parentheses.
+# The cache is emptied at the start of each parse, so it is left unbounded
+# rather than limited to the default 128 entries, which thrashes.
+pp.ParserElement.enable_packrat(cache_size_limit=None)
 
 from .absexpr import AbsExpr
+from .absexpr import OP_ATOM, OP_NEG
 from .prop    import Prop
 from .absfo   import AbsFo
 from .name    import NameMgr
@@ -46,18 +48,23 @@ class Fog(AbsFo):
         _EDG:   string, representing adjacency relation of vertices.
         _EQ:    string, representing equality relation of vertices.
         _LT:    string, representing less-than relation of vertices.
+        _REL_TAGS:   frozenset of strings, representing relation symbols.
         _ATOM_TAGS:  tuple of strings, representing types of atom.
         _BINOP_TAGS: tuple of strings, representing types of binary operator.
         _UNOP_TAGS: tuple of strings, representing types of uniary operator.
         _QF_TAGS:   tuple of strings, representing types of quantifier.
         _EXPR_TAGS: tuple of available tags in this class.
+        _grammar:   parser of read() of each class, built at the first call.
     """
 
+    __slots__ = ()
+
     # Tag-related Variables and Methods
     _EDG = "edg"
     _EQ = "="
     _LT = "<"
 
+    _REL_TAGS = frozenset((_EDG, _EQ, _LT))
     _ATOM_TAGS = AbsFo._ATOM_TAGS + (_EDG, _EQ, _LT)
     _BINOP_TAGS = AbsFo._BINOP_TAGS
     _UNOP_TAGS = AbsFo._UNOP_TAGS
@@ -98,13 +105,17 @@ class Fog(AbsFo):
 
         The order is determined based on the order of names.
         """
+        # nothing to normalize for operators, constants, and quantifiers
+        if len(aux) < 2:
+            return aux
         # sort aux if symmetric relation
-        if tag in [cls.get_edg_tag(), cls.get_eq_tag()]:
-            return tuple(sorted(aux, key=cmp_to_key(cls.cmp_atom_args)))
-        # do not sort if non-symmetric relation
-        if tag == cls.get_lt_tag():
+        if tag == cls._EDG or tag == cls._EQ:
+            x, y = aux
+            if NameMgr.lookup_name(x) > NameMgr.lookup_name(y):
+                return (y, x)
             return aux
-        assert len(aux) < 2
+        # do not sort if non-symmetric relation
+        assert tag == cls._LT
         return aux
 
     @classmethod
@@ -157,6 +168,15 @@ class Fog(AbsFo):
         assert len(args) == 2
         return cls(tag, aux=args)
 
+    @classmethod
+    def _atom_fast(cls, tag: str, x: int, y: int) -> AbsExpr:
+        """Gets the tag-specified relation without validating arguments.
+
+        The caller must ensure that tag is a relation tag and that x and y
+        are indices of named symbols.
+        """
+        return cls(tag, aux=(x, y))
+
     # Instance Methods
     def get_atom_value(self, i: int) -> int:
         """Gets the term, specified by position, of the atomic formula.
@@ -177,7 +197,7 @@ class Fog(AbsFo):
         Returns:
             term given as argument of the atom.
         """
-        if self.is_edg_atom() or self.is_eq_atom() or self.is_lt_atom():
+        if self._tag in self._REL_TAGS:
             if i != 1 and i != 2:
                 raise IndexError("Argument index should be 1 or 2")
         else:
@@ -186,31 +206,36 @@ class Fog(AbsFo):
 
     def is_edg_atom(self) -> bool:
         """Is it an atom of the form edg(x,y) ?"""
-        return self.get_tag() == type(self)._EDG
+        return self._tag == self._EDG
 
     def is_eq_atom(self) -> bool:
         """Is it an atom of the form x=y ?"""
-        return self.get_tag() == type(self)._EQ
+        return self._tag == self._EQ
 
     def is_lt_atom(self) -> bool:
         """Is it an atom of the form x<y ?"""
-        return self.get_tag() == type(self)._LT
+        return self._tag == self._LT
 
-    def compute_nnf_step(self, negated: bool, s: list[list], t: list[list]) -> None:
+    def compute_nnf_step(self, negated: bool, s: list[list], t: list[tuple]) -> None:
         """Performs NNF computation for this object."""
-        if self.is_edg_atom() or self.is_eq_atom() or self.is_lt_atom():
-            t.append([0, lambda: type(self).neg(self) if negated else self])
+        cls = type(self)
+        tag = self._tag
+        if tag in cls._REL_TAGS:
+            t.append((OP_NEG if negated else OP_ATOM, cls, self))
             return
         super().compute_nnf_step(negated, s, t)
 
     def substitute_step(self, y: int, x: int, assoc: dict) -> None:
         """Performs substitution for this object."""
-        if self.is_edg_atom() or self.is_eq_atom() or self.is_lt_atom():
-            op = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            for i, val in enumerate(op):
-                if val == x:
-                    op[i] = y
-            assoc[id(self)] = type(self).atom(self.get_tag(), *op)
+        cls = type(self)
+        tag = self._tag
+        if tag in cls._REL_TAGS:
+            op1, op2 = self._aux
+            if op1 != x and op2 != x:
+                assoc[self] = self
+                return
+            assoc[self] = cls._atom_fast(tag,
+                y if op1 == x else op1, y if op2 == x else op2)
             return
         super().substitute_step(y, x, assoc)
 
@@ -218,7 +243,9 @@ class Fog(AbsFo):
         self, bound_vars: list, free_vars: list
     ) -> None:
         """Performs computation for this object."""
-        if self.is_edg_atom() or self.is_eq_atom() or self.is_lt_atom():
+        cls = type(self)
+        tag = self._tag
+        if tag in cls._REL_TAGS:
             for v in self._aux:
                 if v not in bound_vars:
                     free_vars.append(v)
@@ -228,102 +255,65 @@ class Fog(AbsFo):
 
     def reduce_formula_step(self, assoc: dict, st: BaseRelSt) -> None:
         """Performs reduce computation for this object."""
-
-        if self.is_edg_atom():
-            op = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            if op[0] == op[1]:  # always false regardless of graphs
-                assoc[id(self)] = type(self).false_const()
-                return
-            if NameMgr.is_constant(op[0]) and NameMgr.is_constant(op[1]):
-                if st != None:
-                    if st.adjacent(op[0], op[1]):
-                        assoc[id(self)] = type(self).true_const()
-                    else:
-                        assoc[id(self)] = type(self).false_const()
-                    return
-            assoc[id(self)] = self
-            return
-
-        if self.is_eq_atom():
-            op = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            if op[0] == op[1]:  # always true regardless of graphs
-                assoc[id(self)] = type(self).true_const()
-                return
-            if NameMgr.is_constant(op[0]) and NameMgr.is_constant(op[1]):
-                if st != None:
-                    if st.equal(op[0],op[1]):
-                        assoc[id(self)] = type(self).true_const()
-                    else:
-                        assoc[id(self)] = type(self).false_const()
-                    return
-            assoc[id(self)] = self
-            return
-
-        if self.is_lt_atom():
-            op = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            if op[0] == op[1]:
-                assoc[id(self)] = type(self).false_const()
-                return
-            if NameMgr.is_constant(op[0]) and NameMgr.is_constant(op[1]):
-                if st != None:
-                    if st.lt(op[0], op[1]):
-                        assoc[id(self)] = type(self).true_const()
-                    else:
-                        assoc[id(self)] = type(self).false_const()
-                    return
-            assoc[id(self)] = self
+        cls = type(self)
+        tag = self._tag
+        if tag not in cls._REL_TAGS:
+            super().reduce_formula_step(assoc, st)
             return
 
-        super().reduce_formula_step(assoc, st)
-
-    def perform_boolean_encoding_step(self, assoc: dict, st: BaseRelSt) -> None:
-        """Performs Boolean encoding for this object."""
-        if self.is_edg_atom():
-            atom = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            if atom[0] == atom[1]:
-                assoc[id(self)] = st.be_F()
+        x, y = self._aux
+        if x == y:  # only eq holds, regardless of graphs
+            if tag == cls._EQ:
+                assoc[self] = cls.true_const()
             else:
-                assoc[id(self)] = st.be_edg(atom[0],atom[1])
+                assoc[self] = cls.false_const()
             return
-
-        if self.is_eq_atom():
-            atom = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            if atom[0] == atom[1]: 
-                assoc[id(self)] = st.be_T()
+        if st is not None \
+            and NameMgr.is_constant(x) and NameMgr.is_constant(y):
+            if tag == cls._EDG:
+                holds = st.adjacent(x, y)
+            elif tag == cls._EQ:
+                holds = st.equal(x, y)
             else:
-                assoc[id(self)] = st.be_eq(atom[0],atom[1])
+                holds = st.lt(x, y)
+            assoc[self] = cls.true_const() if holds else cls.false_const()
             return
+        assoc[self] = self
 
-        if self.is_lt_atom():
-            atom = [self.get_atom_arg(1), self.get_atom_arg(2)]
-            if atom[0] == atom[1]:
-                assoc[id(self)] = st.be_F()
+    def perform_boolean_encoding_step(self, assoc: dict, st: BaseRelSt) -> None:
+        """Performs Boolean encoding for this object."""
+        cls = type(self)
+        tag = self._tag
+
+        if tag in cls._REL_TAGS:
+            x, y = self._aux
+            if x == y:  # only eq holds, regardless of graphs
+                assoc[self] = st.be_T() if tag == cls._EQ else st.be_F()
+            elif tag == cls._EDG:
+                assoc[self] = st.be_edg(x, y)
+            elif tag == cls._EQ:
+                assoc[self] = st.be_eq(x, y)
             else:
-                assoc[id(self)] = st.be_lt(atom[0],atom[1])
+                assoc[self] = st.be_lt(x, y)
             return
 
-        if (\
-            self.is_land()\
-            or self.is_lor()\
-            or self.is_implies()\
-            or self.is_iff()\
-        ):
-            left  = assoc[id(self.get_operand(1))]
-            right = assoc[id(self.get_operand(2))]
-            assoc[id(self)] = Prop.binop(self.get_tag(), left, right)
+        if tag in cls._BINOP_TAGS:
+            left  = assoc[self.get_operand(1)]
+            right = assoc[self.get_operand(2)]
+            assoc[self] = Prop.binop(tag, left, right)
             return
 
-        if self.is_neg():
-            op = assoc[id(self.get_operand(1))]
-            assoc[id(self)] = Prop.neg(op)
+        if tag == cls._NEG:
+            op = assoc[self.get_operand(1)]
+            assoc[self] = Prop.neg(op)
             return
 
-        if self.is_true_atom():
-            assoc[id(self)] = st.be_T()
+        if tag == cls._TRUE_CONST:
+            assoc[self] = st.be_T()
             return
 
-        if self.is_false_atom():
-            assoc[id(self)] = st.be_F()
+        if tag == cls._FALSE_CONST:
+            assoc[self] = st.be_F()
             return
 
         assert False
@@ -394,6 +384,24 @@ class Fog(AbsFo):
         if formula_str.strip() == "":
             raise Exception("no formula given")
 
+        EXPR = cls.__dict__.get("_grammar")
+        if EXPR is None:
+            EXPR = cls._build_grammar()
+            cls._grammar = EXPR
+        try:
+            return EXPR.parse_string(formula_str, parse_all=True)[0]
+        finally:
+            # The packrat cache holds parsed subformulas, which would keep
+            # them alive in the unique table until the next parse.
+            pp.ParserElement.reset_cache()
+
+    @classmethod
+    def _build_grammar(cls) -> pp.ParserElement:
+        """Builds the parser of read().
+
+        The parser depends only on the class, and hence it is built on the
+        first call of read() and kept in _grammar of the class.
+        """
         # The following tokens are suppressed in the parsed result.
         COMMA  = pp.Suppress(cls.get_comma_tag())
         LPAREN = pp.Suppress(cls.get_lparen_tag())
@@ -401,8 +409,8 @@ class Fog(AbsFo):
 
         # Variables are strings that match the pattern [a-z_][a-z0-9_]* .
         # Constants are strings that match the pattern [A-Z][A-Z0-9_]* .
-        VAR_SYMB = pp.Word(pp.srange("[a-z]"), pp.srange("[a-z0-9_]"))
-        CON_SYMB = pp.Word(pp.srange("[A-Z]"), pp.srange("[A-Z0-9_]"))
+        VAR_SYMB = pp.Regex(r"[a-z][a-z0-9_]*")
+        CON_SYMB = pp.Regex(r"[A-Z][A-Z0-9_]*")
         TERM = VAR_SYMB | CON_SYMB
 
         EDG_SYMB = pp.Literal(cls.get_edg_tag())
@@ -424,9 +432,6 @@ class Fog(AbsFo):
         OROP = pp.Literal(cls.get_lor_tag())
         IMPLIESOP = pp.Literal(cls.get_implies_tag())
         IFFOP = pp.Literal(cls.get_iff_tag())
-        BINOP = pp.oneOf(" ".join(\
-            [cls.get_land_tag(),cls.get_lor_tag(),\
-            cls.get_implies_tag(),cls.get_iff_tag()]))
 
         ALLOP = pp.Literal(cls.get_forall_tag())
         EXISTSOP = pp.Literal(cls.get_exists_tag())
@@ -447,30 +452,24 @@ class Fog(AbsFo):
 
         @EDG_REL.set_parse_action
         def action_edg_rel(string, location, tokens):
+            # The terms are already symbol indices, see action_*_symb.
             assert len(tokens) == 3, f"{tokens}"
-            if tokens[0] == cls.get_edg_tag():
-                op1 = int(tokens[1])
-                op2 = int(tokens[2])
-                return cls.edg(op1, op2)
-            assert False
+            assert tokens[0] == cls.get_edg_tag(), f"{tokens}"
+            return cls._atom_fast(cls._EDG, tokens[1], tokens[2])
 
         @EQ_REL.set_parse_action
         def action_eq_rel(string, location, tokens):
+            # The terms are already symbol indices, see action_*_symb.
             assert len(tokens) == 3, f"{tokens}"
-            if tokens[1] == cls.get_eq_tag():
-                op1 = int(tokens[0])
-                op2 = int(tokens[2])
-                return cls.eq(op1, op2)
-            assert False
+            assert tokens[1] == cls.get_eq_tag(), f"{tokens}"
+            return cls._atom_fast(cls._EQ, tokens[0], tokens[2])
 
         @LT_REL.set_parse_action
         def action_lt_rel(string, location, tokens):
+            # The terms are already symbol indices, see action_*_symb.
             assert len(tokens) == 3, f"{tokens}"
-            if tokens[1] == cls.get_lt_tag():
-                op1 = int(tokens[0])
-                op2 = int(tokens[2])
-                return cls.lt(op1, op2)
-            assert False
+            assert tokens[1] == cls.get_lt_tag(), f"{tokens}"
+            return cls._atom_fast(cls._LT, tokens[0], tokens[2])
 
         @CON_REL.set_parse_action
         def action_con_rel(string, location, tokens):
@@ -481,13 +480,23 @@ class Fog(AbsFo):
                 return cls.true_const()
             assert False
 
+        BINOP_CONSTRUCTOR = {
+            cls.get_land_tag():    cls.land,
+            cls.get_lor_tag():     cls.lor,
+            cls.get_implies_tag(): cls.implies,
+            cls.get_iff_tag():     cls.iff,
+        }
+
         def action_binop(string, location, tokens):
             # Accumulate tokens in left-associative way.
-            # Many tokens may be given at once when the same operation appears.
+            # Many tokens may be given at once when the same operation appears,
+            # and they all share the operator of the first one.
             assert len(tokens) == 1, f"{tokens}"
             accum = tokens[0][0]
-            for i in range(2, len(tokens[0]), 2):
-                accum = cls.binop(tokens[0][i - 1], accum, tokens[0][i])
+            if len(tokens[0]) > 1:
+                binop = BINOP_CONSTRUCTOR[tokens[0][1]]
+                for i in range(2, len(tokens[0]), 2):
+                    accum = binop(accum, tokens[0][i])
             return accum
 
         def action_unop(string, location, tokens):
@@ -532,63 +541,55 @@ class Fog(AbsFo):
                 (IFFOP, 2, pp.opAssoc.LEFT, action_binop),
             ],
         )
-        return EXPR.parse_string(formula_str, parse_all=True)[0]
+        return EXPR
 
     def make_str_pre_step(self) -> str:
+        cls = type(self)
+        tag = self._tag
 
-        if self.is_edg_atom():
-            name1 = NameMgr.lookup_name(self.get_atom_arg(1))
-            name2 = NameMgr.lookup_name(self.get_atom_arg(2))
+        if tag == cls._EDG:
+            name1, name2 = map(NameMgr.lookup_name, self._aux)
             return f"edg({name1}, {name2})"
 
-        if self.is_eq_atom():
-            name1 = NameMgr.lookup_name(self.get_atom_arg(1))
-            name2 = NameMgr.lookup_name(self.get_atom_arg(2))
+        if tag == cls._EQ:
+            name1, name2 = map(NameMgr.lookup_name, self._aux)
             return f"{name1} = {name2}"
 
-        if self.is_lt_atom():
-            name1 = NameMgr.lookup_name(self.get_atom_arg(1))
-            name2 = NameMgr.lookup_name(self.get_atom_arg(2))
+        if tag == cls._LT:
+            name1, name2 = map(NameMgr.lookup_name, self._aux)
             return f"{name1} < {name2}"
 
         return super().make_str_pre_step()
 
     def make_str_in_step(self) -> str:
+        cls = type(self)
+        tag = self._tag
 
-        if self.is_edg_atom():
-            return ""
-
-        if self.is_eq_atom():
-            return ""
-
-        if self.is_lt_atom():
+        if tag in cls._REL_TAGS:
             return ""
 
         return super().make_str_in_step()
 
     def make_str_post_step(self) -> str:
+        cls = type(self)
+        tag = self._tag
 
-        if self.is_edg_atom():
-            return ""
-
-        if self.is_eq_atom():
-            return ""
-
-        if self.is_lt_atom():
+        if tag in cls._REL_TAGS:
             return ""
 
         return super().make_str_post_step()
 
     def make_node_str_step(self) -> str:
+        cls = type(self)
+        tag = self._tag
 
-        if self.is_edg_atom() or self.is_eq_atom() or self.is_lt_atom():
-            op = []
-            for val in self._aux:
-                op.append(NameMgr.lookup_name(val) if val != 0 else "-")
-            if self.is_edg_atom():
+        if tag in cls._REL_TAGS:
+            op = [NameMgr.lookup_name(val) if val != 0 else "-"
+                    for val in self._aux]
+            if tag == cls._EDG:
                 return f'"edg({op[0]},{op[1]})"'
-            if self.is_eq_atom():
+            if tag == cls._EQ:
                 return f'"{op[0]}={op[1]}"'
-            if self.is_edg_atom():
-                return f'"{op[0]}<{op[1]}"'
+            return f'"{op[0]}<{op[1]}"'
         return super().make_node_str_step()
+
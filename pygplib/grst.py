@@ -125,6 +125,8 @@ class GrSt(SymRelSt):
         """dictionary of auxiliary Boolean variables for the order relation"""
         self._le_dec_dict = {} 
         """Inverse mapping of _le_enc_dict"""
+        self._lit_dict = {}
+        """dictionary mapping symbol index to tuple of literals"""
         self._encoding = encoding
         """encoding type"""
         self._prefix   = prefix
@@ -151,8 +153,12 @@ class GrSt(SymRelSt):
         self._G = SimpGraph()
         for v in objects:
             self._G.add_vertex(v)
+        self._adjacent_pairs = set()
+        """set of ordered pairs of adjacent objects, in both orientations"""
         for v,w in self.vertex_to_object(self._edges):
             self._G.add_edge(v,w)
+            self._adjacent_pairs.add((v,w))
+            self._adjacent_pairs.add((w,v))
         if len(objects) > 0:
             self.max_v = objects[0]
             for v in objects[1:]:
@@ -161,13 +167,15 @@ class GrSt(SymRelSt):
 
     def _out_neighborhood(self, v: int):
         assert v in self.domain
+        mask = self.get_code_mask(v)
         return tuple([w for w in self.domain
-            if self._object_to_pos(w)+1 in self.get_code(v) and v != w])
+            if mask >> self._object_to_pos(w) & 1 and v != w])
 
     def _in_neighborhood(self, v: int):
         assert v in self.domain
+        pos = self._object_to_pos(v)
         return tuple([w for w in self.domain
-            if self._object_to_pos(v)+1 in self.get_code(w) and v != w])
+            if self.get_code_mask(w) >> pos & 1 and v != w])
 
     def _compute_relation_edge_enc(self):
         return self.vertex_to_object(self._edges)
@@ -284,11 +292,11 @@ class GrSt(SymRelSt):
         Returns:
             True if adjacent, and False otherwise.
         """
-        if x not in self.domain:
+        if x not in self._domain_set:
             raise Exception(f"{x} is not a domain object.")
-        if y not in self.domain:
+        if y not in self._domain_set:
             raise Exception(f"{y} is not a domain object.")
-        return x in self._G.adj_vertices(y)
+        return (x, y) in self._adjacent_pairs
 
     def equal(self, x: int, y: int) -> bool:
         """Determines if constants (meaning vertices) are equal with each other.
@@ -299,9 +307,9 @@ class GrSt(SymRelSt):
         Returns:
             True if equal, and False otherwise.
         """
-        if x not in self.domain:
+        if x not in self._domain_set:
             raise Exception(f"{x} is not a domain object.")
-        if y not in self.domain:
+        if y not in self._domain_set:
             raise Exception(f"{y} is not a domain object.")
         return x == y
 
@@ -314,19 +322,9 @@ class GrSt(SymRelSt):
         Returns:
             True if x is less than y, and False otherwise.
         """
-        px = self._get_lit_list(x)
-        py = self._get_lit_list(y)
-        for i in range(self.code_length):
-            i = self.code_length-i-1
-            assert px[i] in [Prop.true_const(), Prop.false_const()]
-            assert py[i] in [Prop.true_const(), Prop.false_const()]
-            if px[i] == py[i]:
-                continue
-            if px[i] == Prop.false_const() and py[i] == Prop.true_const():
-                return True
-            if px[i] == Prop.true_const()  and py[i] == Prop.false_const():
-                return False
-        return False
+        # Comparing codes from the last position downward is the same as
+        # comparing their bitmasks as integers.
+        return self.get_code_mask(x) < self.get_code_mask(y)
 
     def sorted(self, li: list) -> None:
         """Sorts list of constants (i.e. vertices) in an increasing order.
@@ -355,20 +353,39 @@ class GrSt(SymRelSt):
             assert self.lt(res[i],res[i+1]) or self.equal(res[i],res[i+1])
         return res
 
-    def _get_lit_list(self, x: int) -> list[Prop]:
-        """Gets list of literals, given a symbol index.
+    def _get_lit_list(self, x: int) -> tuple[Prop]:
+        """Gets tuple of literals, given a symbol index.
 
         Args:
             x: symbol index (constant symbol or variable symbol)
         Returns:
-            list of literals (Boolean variables' objects of Prop class)
+            tuple of literals (Boolean variables' objects of Prop class)
         """
-        if x in self.domain:
-            return [Prop.true_const() if i+1 in self.get_code(x) \
-                        else Prop.false_const() \
-                            for i in range(self.code_length)]
-        else:
-            return [Prop.var(p) for p in self.get_boolean_var_list(x)]
+        res = self._lit_dict.get(x)
+        if res is None:
+            if x in self._domain_set:
+                true  = Prop.true_const()
+                false = Prop.false_const()
+                mask  = self.get_code_mask(x)
+                res = tuple([true if mask >> i & 1 else false \
+                                for i in range(self.code_length)])
+            else:
+                res = tuple(map(Prop.var, self.get_boolean_var_list(x)))
+            self._lit_dict[x] = res
+        return res
+
+    @staticmethod
+    def _binop_batch_unique(tag: str, li: list) -> Prop:
+        """Applies binop_batch() to operands, dropping repeated ones.
+
+        Identical subformulas are the same object, and AND and OR are
+        idempotent, so later occurrences of an operand can be dropped.
+        This happens in the direct and log encodings of edg when an
+        argument is a constant: the per-edge operands are then built from
+        T and F, or from be_eq() against constants, which also reduces to
+        T or F, so many of them coincide.
+        """
+        return Prop.binop_batch(tag, list(dict.fromkeys(li)))
 
     def encode_eq(self, x: int, y: int) -> Prop:
         """Encodes predicate of equality relation, given two symbols.
@@ -395,6 +412,17 @@ class GrSt(SymRelSt):
         return self._be_eq_dict[self._encoding](x,y)
 
     def _be_eq_arbit_enc(self, x: int, y: int) -> Prop:
+        if x in self._domain_set and y in self._domain_set:
+            return Prop.true_const() if x == y else Prop.false_const()
+        if x in self._domain_set:
+            x, y = y, x
+        if y in self._domain_set:
+            # Compare with the code of a constant literal by literal.
+            px = self._get_lit_list(x)
+            mask = self.get_code_mask(y)
+            li = [px[i] if mask >> i & 1 else Prop.neg(px[i])
+                    for i in range(self.code_length)]
+            return Prop.binop_batch(Prop.get_land_tag(), li)
         px = self._get_lit_list(x)
         py = self._get_lit_list(y)
         li = [Prop.iff(px[i],py[i]) for i in range(self.code_length)]
@@ -425,6 +453,21 @@ class GrSt(SymRelSt):
         return self._be_edg_dict[self._encoding](x,y)
 
     def _be_edg_edge_enc(self, x: int, y: int) -> Prop:
+        if x in self._domain_set and y in self._domain_set:
+            adjacent = x != y \
+                and self.get_code_mask(x) & self.get_code_mask(y) != 0
+            return Prop.true_const() if adjacent else Prop.false_const()
+        if x in self._domain_set:
+            x, y = y, x
+        if y in self._domain_set:
+            # Only the positions in the code of a constant can be shared.
+            px = self._get_lit_list(x)
+            mask = self.get_code_mask(y)
+            li = [px[i] for i in range(self.code_length) if mask >> i & 1]
+            if len(li) == 0:
+                return Prop.false_const()
+            return Prop.land(Prop.neg(self.be_eq(x,y)),
+                Prop.binop_batch(Prop.get_lor_tag(), li))
         px = self._get_lit_list(x)
         py = self._get_lit_list(y)
         li = [Prop.land(px[i],py[i]) for i in range(self.code_length)]
@@ -446,7 +489,7 @@ class GrSt(SymRelSt):
             return Prop.false_const()
         else:
             return Prop.land(Prop.neg(self.be_eq(x,y)),
-                Prop.binop_batch(Prop.get_lor_tag(), li))
+                self._binop_batch_unique(Prop.get_lor_tag(), li))
 
     def _be_edg_arbit_enc(self, x: int, y: int) -> Prop:
         li = [Prop.lor(
@@ -461,7 +504,7 @@ class GrSt(SymRelSt):
             return Prop.false_const()
         else:
             return Prop.land(Prop.neg(self.be_eq(x,y)),
-                Prop.binop_batch(Prop.get_lor_tag(), li))
+                self._binop_batch_unique(Prop.get_lor_tag(), li))
 
     def _be_edg_vertex_enc(self, x: int, y: int) -> Prop:
         def _aux_index(x: int, i: int) -> int:
@@ -6,6 +6,8 @@ from collections.abc import Iterable
 
 from .absexpr  import AbsExpr
 from .absexpr  import IndexGen
+from .absexpr  import OP_ATOM, OP_NEG, OP_LAND, OP_LOR
+from .absexpr  import OP_FORALL, OP_EXISTS
 from .prop     import Prop, Props
 from .absfo    import AbsFo
 from .name     import NameMgr
@@ -127,17 +129,17 @@ def to_str(f: AbsExpr) -> str:
     The same formula can be constructed, by read(), from the string
     produced by this method.
     """
-    out = ""
+    out = []  # fragments of string, joined at the end
 
     for i, subexpr in generate_subformulas(f):
         if i == 0:
-            out += subexpr.make_str_pre_step()
+            out.append(subexpr.make_str_pre_step())
         elif i == 1:
-            out += subexpr.make_str_in_step()
+            out.append(subexpr.make_str_in_step())
         elif i == 2:
-            out += subexpr.make_str_post_step()
+            out.append(subexpr.make_str_post_step())
 
-    return out
+    return "".join(out)
 
 
 def print_formula(f: AbsExpr, stream=None, graph_name="output", fmt="str") -> None:
@@ -159,28 +161,28 @@ def print_formula(f: AbsExpr, stream=None, graph_name="output", fmt="str") -> No
     if fmt != "dot":
         raise Exception(f"invalid format {format}")
 
-    out = "digraph " + f"{graph_name}" + " {\n"
+    out = [f"digraph {graph_name} {{\n"]
     for i, g in generate_subformulas(f, skip_shared=True):
         if i == 0:
-            out += "\t" + f"{id(g)} [label = {g.make_node_str_step()}]\n"
+            out.append(f"\t{id(g)} [label = {g.make_node_str_step()}]\n")
         elif i == 1:
             continue
         elif i == 2:
             if g.is_binop():
-                out += f"\t{id(g)}" + " -> " + f"{id(g.get_operand(1))}\n"
-                out += f"\t{id(g)}" + " -> " + f"{id(g.get_operand(2))}\n"
+                out.append(f"\t{id(g)} -> {id(g.get_operand(1))}\n")
+                out.append(f"\t{id(g)} -> {id(g.get_operand(2))}\n")
             elif g.is_unop():
-                out += f"\t{id(g)}" + " -> " + f"{id(g.get_operand(1))}\n"
+                out.append(f"\t{id(g)} -> {id(g.get_operand(1))}\n")
             elif g.is_atom():
                 continue
             elif isinstance(g, AbsFo) and g.is_qf():
-                out += f"\t{id(g)}" + " -> " + f"{id(g.get_operand(1))}\n"
+                out.append(f"\t{id(g)} -> {id(g.get_operand(1))}\n")
             else:
                 raise Exception(f"unexpected term: {g.gen_key()}")
 
     if stream != None:
-        out += "}\n"
-        stream.write(out)
+        out.append("}\n")
+        stream.write("".join(out))
 
 
 def compute_nnf(f: AbsExpr) -> AbsExpr:
@@ -196,20 +198,31 @@ def compute_nnf(f: AbsExpr) -> AbsExpr:
     def _build_formula_posfix(t: list) -> AbsExpr:
         s = []
         while t != []:
-            i, func = t.pop()
-            if i == 0:
-                s.append(func())
+            code, cls, arg = t.pop()
+            if code == OP_ATOM:
+                s.append(arg)
                 continue
 
-            if i == 1:
-                left = s.pop()
-                s.append(func(left))
+            if code == OP_NEG:
+                s.append(cls.neg(arg))
                 continue
 
-            if i == 2:
+            if code == OP_LAND:
                 right = s.pop()
-                left = s.pop()
-                s.append(func(left, right))
+                s.append(cls.land(s.pop(), right))
+                continue
+
+            if code == OP_LOR:
+                right = s.pop()
+                s.append(cls.lor(s.pop(), right))
+                continue
+
+            if code == OP_FORALL:
+                s.append(cls.forall(s.pop(), arg))
+                continue
+
+            if code == OP_EXISTS:
+                s.append(cls.exists(s.pop(), arg))
                 continue
 
             assert False
@@ -242,15 +255,15 @@ def reduce_formula(f: AbsExpr, st: BaseRelSt = None) -> AbsExpr:
     nnf = compute_nnf(f)
 
     assoc = {}
-    for i, g in generate_subformulas(nnf):
+    # Note: reduce_formula_step() depends only on the node, its reduced
+    # operands, and st, so each shared subformula is visited only once.
+    for i, g in generate_subformulas(nnf, skip_shared=True):
         if i != 2:
             continue
-        if id(g) in assoc:
-            continue
         g.reduce_formula_step(assoc, st)
 
-    assert id(nnf) in assoc
-    return assoc[id(nnf)]
+    assert nnf in assoc
+    return assoc[nnf]
 
 def reduce(f: AbsExpr, st: BaseRelSt = None) -> AbsExpr:
     """Reduces it into as simple formula as possible, retaining equivalence.
@@ -327,14 +340,14 @@ def substitute(expr: AbsFo, y: int, x: int) -> AbsFo:
             if g.is_forall() or g.is_exists():
                 if g.get_bound_var() == x:
                     nof_bound -= 1
-            if id(g) in assoc:
+            if g in assoc:
                 continue
             if nof_bound == 0:
                 g.substitute_step(y, x, assoc)
             continue
     assert nof_bound == 0
-    assert id(expr) in assoc
-    return assoc[id(expr)]
+    assert expr in assoc
+    return assoc[expr]
 
 
 def _eliminate_qf_step(
@@ -347,12 +360,12 @@ def _eliminate_qf_step(
     """
 
     if expr.is_neg():
-        g = assoc[id(expr.get_operand(1))]
-        assoc[id(expr)] = type(expr).neg(g)
+        g = assoc[expr.get_operand(1)]
+        assoc[expr] = type(expr).neg(g)
         return
 
     if expr.is_true_atom() or expr.is_false_atom():
-        assoc[id(expr)] = expr
+        assoc[expr] = expr
         return
 
     if (
@@ -361,14 +374,14 @@ def _eliminate_qf_step(
         or expr.is_implies()
         or expr.is_iff()
     ):
-        left = assoc[id(expr.get_operand(1))]
-        right = assoc[id(expr.get_operand(2))]
-        assoc[id(expr)] = type(expr).binop(expr.get_tag(), left, right)
+        left = assoc[expr.get_operand(1)]
+        right = assoc[expr.get_operand(2)]
+        assoc[expr] = type(expr).binop(expr.get_tag(), left, right)
         return
 
     if expr.is_forall() or expr.is_exists():
         bvar = expr.get_bound_var()
-        g = assoc[id(expr.get_operand(1))]
+        g = assoc[expr.get_operand(1)]
 
         li = [substitute(g, d, bvar) for d in const_symb_tup]
 
@@ -377,11 +390,11 @@ def _eliminate_qf_step(
         else:
             acc = type(expr).binop_batch(type(expr).get_lor_tag(), li)
 
-        assoc[id(expr)] = acc
+        assoc[expr] = acc
         return
 
     if expr.is_edg_atom() or expr.is_eq_atom() or expr.is_lt_atom():
-        assoc[id(expr)] = expr
+        assoc[expr] = expr
         return
 
     assert False
@@ -401,20 +414,21 @@ def eliminate_qf(expr: AbsFo, st: BaseRelSt) -> AbsFo:
     """
     if not issubclass(type(expr), AbsFo):
         raise TypeError("Expression must be an instance of AbsFo or its subclass")
-    if st == None:
+    if st is None:
         raise Exception("Set relational structure")
     const_symb_tup = st.domain
 
     assoc = {}
-    for i, g in generate_subformulas(expr):
+    # Note: the result of _eliminate_qf_step() depends only on the
+    # subformula itself, not on where it occurs, so each shared subformula
+    # is visited only once.
+    for i, g in generate_subformulas(expr, skip_shared=True):
         if i != 2:
             continue
-        if id(g) in assoc:
-            continue
         _eliminate_qf_step(g, const_symb_tup, assoc)
 
-    assert id(expr) in assoc
-    return assoc[id(expr)]
+    assert expr in assoc
+    return assoc[expr]
 
 def _check_no_missing_variable_in_prop(f: Prop, st: BaseRelSt):
     """Checks whether there is no missing variable in prop formula.
@@ -493,12 +507,12 @@ def perform_boolean_encoding(f: AbsFo, st: BaseRelSt) -> Prop:
     for i, g in generate_subformulas(qf_free, skip_shared=True):
         if i != 2:
             continue
-        if id(g) in assoc:
+        if g in assoc:
             continue
         g.perform_boolean_encoding_step(assoc, st)
 
-    assert id(qf_free) in assoc
-    return assoc[id(qf_free)]
+    assert qf_free in assoc
+    return assoc[qf_free]
 
 
 def propnize(f: AbsFo, st: BaseRelSt) -> Prop:
@@ -528,6 +542,62 @@ def get_prop_vars(f: Prop) -> tuple:
             for i, g in generate_subformulas(f, skip_shared=True)
             if i == 2 and g.is_var_atom()]))
 
+def compile_evaluator(f: Prop):
+    """Compiles Prop formula into a Python function evaluating it.
+
+    The returned function takes a model, an iterable of literals in the
+    same form as models of SAT solvers (a positive index for a true
+    variable, a negative index for a false one), and returns the truth
+    value of the formula under it.
+    Variables not occurring positively in the model are regarded as false.
+
+    The function is generated once as Python source with a local variable
+    per (shared) subformula, so evaluating a formula against many models
+    does not traverse the formula each time.
+
+    Args:
+        f:  propositional formula to be compiled.
+
+    Returns:
+        callable:   function taking a model and returning bool.
+    """
+    if not isinstance(f, Prop):
+        raise TypeError("Expression must be an instance of Prop")
+
+    name = {}  # subformula -> name of local variable holding its value
+    lines = ["def evaluate(model):",
+             "    pos = {lit for lit in model if lit > 0}"]
+    for i, g in generate_subformulas(f, skip_shared=True):
+        if i != 2:
+            continue
+        if g.is_var_atom():
+            val = f"{g.get_var_index()} in pos"
+        elif g.is_true_atom():
+            val = "True"
+        elif g.is_false_atom():
+            val = "False"
+        elif g.is_neg():
+            val = f"not {name[g.get_operand(1)]}"
+        else:
+            left = name[g.get_operand(1)]
+            right = name[g.get_operand(2)]
+            if g.is_land():
+                val = f"{left} and {right}"
+            elif g.is_lor():
+                val = f"{left} or {right}"
+            elif g.is_implies():
+                val = f"not {left} or {right}"
+            else:
+                assert g.is_iff()
+                val = f"{left} == {right}"
+        name[g] = f"v{len(name)}"
+        lines.append(f"    {name[g]} = {val}")
+    lines.append(f"    return {name[f]}")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["evaluate"]
+
 def compute_cnf(data: Props) -> tuple[int, int, tuple[tuple[int, ...], ...]]:
     """Computes Conjunction Normal Form for Props using Tsentin transformation.
 
@@ -573,17 +643,19 @@ def compute_cnf(data: Props) -> tuple[int, int, tuple[tuple[int, ...], ...]]:
     igen = IndexGen(base + 1)
     cnf = []
     # cnf encoding
+    # Note: assoc is shared among formulas so that a subformula shared by
+    # several formulas is encoded once, with the same auxiliary variable.
+    assoc = {}
     for f in expr_li:
         if f.is_true_atom():
             continue
-        assoc = {}
         for i, g in generate_subformulas(f, skip_shared=True):
             if i != 2:
                 continue
-            if id(g) in assoc:
+            if g in assoc:
                 continue
             g.compute_cnf_step(igen, assoc, cnf)
-        assert id(f) in assoc
-        cnf.append((assoc[id(f)],))
+        assert f in assoc
+        cnf.append((assoc[f],))
     naux = igen.get_count()  # nof aux. variables
     return base, naux, tuple(cnf)
@@ -5,9 +5,13 @@ from collections.abc import Iterable
 import pyparsing as pp
 # Enables "packrat" parsing, which speedup parsing.
 # See https://pyparsing-docs.readthedocs.io/en/latest/pyparsing.html .
-pp.ParserElement.enable_packrat()
+# Without it, infix_notation backtracks exponentially in nested parentheses.
+# The cache is emptied at the start of each parse, so it is left unbounded
+# rather than limited to the default 128 entries, which thrashes.
+pp.ParserElement.enable_packrat(cache_size_limit=None)
 
 from .absexpr import AbsExpr
+from .absexpr import OP_ATOM, OP_NEG
 from .absexpr import IndexGen
 from .absprop import AbsProp
 from .name import NameMgr
@@ -30,8 +34,11 @@ class Prop(AbsProp):
         _BINOP_TAGS: tuple of strings, representing types of binary operator.
         _UNOP_TAGS: tuple of strings, representing types of uniary operator.
         _EXPR_TAGS: tuple of available tags in this class.
+        _grammar:   parser of read() of each class, built at the first call.
     """
 
+    __slots__ = ()
+
     # Tag-related Variables and Methods
     _VAR = "X"
 
@@ -75,10 +82,10 @@ class Prop(AbsProp):
         """Is the formula a Boolean variable ?"""
         return self.get_tag() == type(self)._VAR
 
-    def compute_nnf_step(self, negated: bool, s: list[list], t: list[list]) -> None:
+    def compute_nnf_step(self, negated: bool, s: list[list], t: list[tuple]) -> None:
         """Performs NNF computation for this object."""
         if self.is_var_atom():
-            t.append([0, lambda: type(self).neg(self) if negated else self])
+            t.append((OP_NEG if negated else OP_ATOM, type(self), self))
             return
         super().compute_nnf_step(negated, s, t)
 
@@ -86,7 +93,7 @@ class Prop(AbsProp):
         assoc: dict, cnf: list) -> None:
         """Peforms CNF computation for this object."""
         if self.is_var_atom():
-            assoc[id(self)] = self.get_var_index()
+            assoc[self] = self.get_var_index()
         else:
             super().compute_cnf_step(igen, assoc, cnf)
 
@@ -133,12 +140,30 @@ class Prop(AbsProp):
         if formula_str.strip() == "":
             raise Exception("no formula given")
 
+        EXPR = cls.__dict__.get("_grammar")
+        if EXPR is None:
+            EXPR = cls._build_grammar()
+            cls._grammar = EXPR
+        try:
+            return EXPR.parse_string(formula_str, parse_all=True)[0]
+        finally:
+            # The packrat cache holds parsed subformulas, which would keep
+            # them alive in the unique table until the next parse.
+            pp.ParserElement.reset_cache()
+
+    @classmethod
+    def _build_grammar(cls) -> pp.ParserElement:
+        """Builds the parser of read().
+
+        The parser depends only on the class, and hence it is built on the
+        first call of read() and kept in _grammar of the class.
+        """
         # The following tokens are suppressed in the parsed result.
         COMMA = pp.Suppress(cls.get_comma_tag())
         LPAREN = pp.Suppress(cls.get_lparen_tag())
         RPAREN = pp.Suppress(cls.get_rparen_tag())
 
-        VAR = pp.Word(pp.srange("[a-z_]"), pp.srange("[a-z0-9_]"))
+        VAR = pp.Regex(r"[a-z_][a-z0-9_]*")
 
         TRUE = pp.Literal(cls.get_true_const_tag())
         FALSE = pp.Literal(cls.get_false_const_tag())
@@ -152,9 +177,6 @@ class Prop(AbsProp):
         OROP = pp.Literal(cls.get_lor_tag())
         IMPLIESOP = pp.Literal(cls.get_implies_tag())
         IFFOP = pp.Literal(cls.get_iff_tag())
-        BINOP = pp.oneOf(" ".join(\
-            [cls.get_land_tag(),cls.get_lor_tag(),\
-            cls.get_implies_tag(),cls.get_iff_tag()]))
 
         @VAR.set_parse_action
         def action_var(string, location, tokens):
@@ -175,13 +197,23 @@ class Prop(AbsProp):
             assert tokens[0][0] == cls.get_neg_tag(), f"{tokens[0]}"
             return cls.neg(tokens[0][1])
 
+        BINOP_CONSTRUCTOR = {
+            cls.get_land_tag():    cls.land,
+            cls.get_lor_tag():     cls.lor,
+            cls.get_implies_tag(): cls.implies,
+            cls.get_iff_tag():     cls.iff,
+        }
+
         def action_binop(string, location, tokens):
             # Accumulate in left-associative way.
-            # Many tokens may be given at once when the same operation appears.
+            # Many tokens may be given at once when the same operation appears,
+            # and they all share the operator of the first one.
             assert len(tokens) == 1, f"{tokens}"
             accum = tokens[0][0]
-            for i in range(2, len(tokens[0]), 2):
-                accum = cls.binop(tokens[0][i - 1], accum, tokens[0][i])
+            if len(tokens[0]) > 1:
+                binop = BINOP_CONSTRUCTOR[tokens[0][1]]
+                for i in range(2, len(tokens[0]), 2):
+                    accum = binop(accum, tokens[0][i])
             return accum
 
         # NOTE: Do not change the order of operators below,
@@ -199,12 +231,12 @@ class Prop(AbsProp):
             lpar=LPAREN,
             rpar=RPAREN,
         )
-        return EXPR.parse_string(formula_str, parse_all=True)[0]
+        return EXPR
 
     def reduce_formula_step(self, assoc: dict, st: BaseRelSt) -> None:
         """Performs reduce computation for this object."""
         if self.is_var_atom():
-            assoc[id(self)] = self
+            assoc[self] = self
             return
         super().reduce_formula_step(assoc, st)
 
@@ -1,4 +1,6 @@
+import gc
 import random
+import weakref
 
 from pygplib import Fog, NameMgr, GrSt, Prop
 import pygplib.op as op
@@ -242,6 +244,15 @@ def gen_form_rand(depth: int = 3) -> Fog:
     assert False
 
 
+def test_read_releases_formula():
+    NameMgr.clear()
+    f = Fog.read("edg(x,y) & ~x=y")
+    ref = weakref.ref(f)
+    del f
+    gc.collect()
+    assert ref() is None
+    assert Fog.read("edg(x,y) & ~x=y") is not None
+
 def test_format():
     NameMgr.clear()
 
@@ -963,6 +963,55 @@ def _test_be_edg(encoding: str,
             else:
                 solver.assert_unsatisfiable(f,msg=msg+pair)
 
+def test_be_const_var():
+    tests = [
+        ("direct", False,False),
+        ("log",    False,False),
+        ("vertex", False,False),
+        ("edge",   True, True),
+        ("clique", True, True),
+     ]
+    for step in range(3):
+        for encoding,reject_isolated_vertex,reject_isolated_edge in tests:
+            _test_be_const_var(encoding=encoding,
+                reject_isolated_vertex=reject_isolated_vertex,
+                reject_isolated_edge=reject_isolated_edge)
+
+def _test_be_const_var(encoding: str,
+    reject_isolated_vertex: bool,
+    reject_isolated_edge: bool):
+    """Compares encodings with a constant and a variable with the general
+    ones, in which the code of the constant is given as literals T and F."""
+    NameMgr.clear()
+    x = NameMgr.lookup_index("x")
+    n = 5 # number of vertices
+    m = random.randint(0,(n*(n-1))//2) # number of edges
+    G = graph.random_graph(n,m,
+        reject_isolated_vertex=reject_isolated_vertex,
+        reject_isolated_edge=reject_isolated_edge)
+    if G is None:
+        return
+    vertex_list = list(G.all_vertices())
+    edge_list   = list(G.all_edges())
+    random.shuffle(vertex_list)
+    random.shuffle(edge_list)
+    msg  = "V=["+",".join(map(str,vertex_list))+"]"
+    msg += ",E=["+",".join(map(str,edge_list))+"]"
+    msg += f",encoding={encoding}"
+    st = GrSt(vertex_list, edge_list, encoding=encoding, msg=msg)
+    px = st._get_lit_list(x)
+    for u in st.domain:
+        pu = st._get_lit_list(u)
+        eq = Prop.binop_batch(Prop.get_land_tag(),
+            [Prop.iff(px[i],pu[i]) for i in range(st.code_length)])
+        edg = Prop.land(Prop.neg(eq), Prop.binop_batch(Prop.get_lor_tag(),
+            [Prop.land(px[i],pu[i]) for i in range(st.code_length)]))
+        for a, b in ((x,u), (u,x)):
+            pair = f",(a,b)=({a},{b})"
+            solver.assert_equivalence(st.be_eq(a,b), eq, msg=msg+pair)
+            if encoding in ("edge", "clique"):
+                solver.assert_equivalence(st.be_edg(a,b), edg, msg=msg+pair)
+
 def test_be_lt():
     tests = [
         ("direct", False,False),
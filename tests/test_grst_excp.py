@@ -179,3 +179,16 @@ def test_init():
         NameMgr.clear()
         with pytest.raises(expected):
             st = GrSt(vertex_list,edge_list,encoding=encoding,prefix=prefix)
+
+
+def test_adjacent():
+    NameMgr.clear()
+    st = GrSt([1,2,3],[(1,2),(2,3)],encoding="log",prefix="V")
+    # codes are looked up in the same table as objects but are not objects
+    for x in st.domain:
+        code = st.get_code(x)
+        for method in (st.adjacent, st.equal):
+            with pytest.raises(Exception):
+                method(code, x)
+            with pytest.raises(Exception):
+                method(x, code)
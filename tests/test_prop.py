@@ -138,6 +138,38 @@ def test_compute_cnf():
         g  = Prop.read(expected)
         solver.assert_equivalence(f,g)
 
+def test_compile_evaluator():
+    tests = [
+        # formula,           true variables, expected value
+        ("T",                [],             True),
+        ("F",                [],             False),
+        ("~T",               [],             False),
+        ("x",                ["x"],          True),
+        ("x",                [],             False),
+        ("~~x",              ["x"],          True),
+        ("x & y",            ["x"],          False),
+        ("x & y",            ["x", "y"],     True),
+        ("x | y",            ["y"],          True),
+        ("x | y",            [],             False),
+        ("x -> y",           ["x"],          False),
+        ("x -> y",           [],             True),
+        ("x <-> y",          [],             True),
+        ("x <-> y",          ["y"],          False),
+        ("~ (x & y -> z) | x", ["y"],        False),
+        ("(x<->z) & ~y | x", ["z"],          False),
+        ("(x<->z) & ~y | x", ["x", "y"],     True),
+        ("(x | y) & (x | y)", ["y"],         True),
+    ]
+    NameMgr.clear()
+
+    for formula, true_vars, expected in tests:
+        f = Prop.read(formula)
+        evaluate = op.compile_evaluator(f)
+        model = [NameMgr.lookup_index(name) if name in true_vars\
+                    else -NameMgr.lookup_index(name)\
+                    for name in ["x", "y", "z"]]
+        assert evaluate(model) == expected, f"{formula}, {true_vars}"
+
 def test_size():
     tests = [
         ("T", 1),